@@ -0,0 +1,10 @@
+from Model import PCBuilder
+
+
+pc_builder = PCBuilder()
+
+updated = pc_builder.backfill_build_hashes()
+print(f" {updated} builds backfilled with component hashes.")
+
+pc_builder.close_connection()
+print(" Connection closed.")
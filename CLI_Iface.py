@@ -1,12 +1,49 @@
-import inquirer
+import argparse
 import sys
 import json
-from Model import PCBuilder
+import time
+
+_import_started = time.perf_counter()
+import inquirer
+INQUIRER_IMPORT_SECONDS = time.perf_counter() - _import_started
+
+from Profiler import CLIProfiler
 
 class PCBuildCLI:
-    def __init__(self):
-        self.pc_builder = PCBuilder()
+    def __init__(self, profiler=None):
+        self.profiler = profiler or CLIProfiler()
+        self._pc_builder = None
         self.selected_components = {}
+
+    @property
+    def pc_builder(self):
+        """Import Model and connect to the database on first use"""
+        if self._pc_builder is None:
+            with self.profiler.startup_step("import Model"):
+                import Model
+            with self.profiler.startup_step("load .env"):
+                Model.load_environment()
+            with self.profiler.startup_step("connect to database"):
+                self._pc_builder = Model.PCBuilder()
+        return self._pc_builder
+
+    def connect(self):
+        """Open the deferred DB connection outside any profiled action
+
+        Keeps the one-off import/connect cost in the startup report instead
+        of inflating the first action that touches the database.
+        """
+        return self.pc_builder
+
+    def prompt(self, questions):
+        """Ask the user, keeping the wait for an answer out of profiled action timings"""
+        with self.profiler.paused():
+            return inquirer.prompt(questions)
+
+    def close(self):
+        """Close the database connection if one was opened"""
+        if self._pc_builder:
+            self._pc_builder.close_connection()
     
     def get_component_choices(self, component_type):
         """Get all components of a specific type for selection"""
@@ -41,7 +78,7 @@ class PCBuildCLI:
             )
         ]
         
-        answer = inquirer.prompt(questions)
+        answer = self.prompt(questions)
         if answer and answer['component']:
             return answer['component']
         return None
@@ -101,7 +138,7 @@ class PCBuildCLI:
                                message="Build has compatibility issues. Save anyway?",
                                default=False)
             ]
-            answer = inquirer.prompt(questions)
+            answer = self.prompt(questions)
             if not answer or not answer['save_anyway']:
                 return
         
@@ -110,13 +147,15 @@ class PCBuildCLI:
             inquirer.Text('name', message="Enter a name for your build")
         ]
         
-        answer = inquirer.prompt(questions)
+        answer = self.prompt(questions)
         if answer and answer['name']:
             component_ids = [comp.id for comp in self.selected_components.values()]
-            success, message = self.pc_builder.save_build(answer['name'], component_ids)
+            success, message, build, created = self.pc_builder.find_or_save_build(answer['name'], component_ids)
             
-            if success:
+            if success and created:
                 print(f"\n✅ {message}")
+            elif success:
+                print(f"\nℹ️  Not saved again: build '{build.name}' (ID: {build.id}) already has these components")
             else:
                 print(f"\n❌ {message}")
 
@@ -136,7 +175,7 @@ class PCBuildCLI:
                          choices=type_choices,
                          carousel=True)
         ]
-        answer = inquirer.prompt(questions)
+        answer = self.prompt(questions)
         if not answer:
             return
             
@@ -144,7 +183,7 @@ class PCBuildCLI:
             questions = [
                 inquirer.Text('new_type', message="Enter new component type")
             ]
-            new_type_answer = inquirer.prompt(questions)
+            new_type_answer = self.prompt(questions)
             if not new_type_answer or not new_type_answer['new_type']:
                 return
             comp_type = new_type_answer['new_type']
@@ -155,7 +194,7 @@ class PCBuildCLI:
         questions = [
             inquirer.Text('name', message="Enter component name")
         ]
-        answer = inquirer.prompt(questions)
+        answer = self.prompt(questions)
         if not answer or not answer['name']:
             return
             
@@ -168,7 +207,7 @@ class PCBuildCLI:
                 inquirer.Text('socket', message="Socket (e.g., LGA1700, AM4, AM5) - REQUIRED for compatibility"),
                 inquirer.Text('tdp', message="TDP (e.g., 65W, 125W) - Optional")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer:
                 specs = {k: v for k, v in spec_answer.items() if v}
                 
@@ -177,7 +216,7 @@ class PCBuildCLI:
                 inquirer.Text('interface', message="Interface (e.g., PCIe 4.0) - REQUIRED for compatibility"),
                 inquirer.Text('tdp', message="TDP (e.g., 220W) - Optional")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer:
                 specs = {k: v for k, v in spec_answer.items() if v}
                 
@@ -186,7 +225,7 @@ class PCBuildCLI:
                 inquirer.Text('type', message="RAM Type (e.g., DDR4, DDR5) - REQUIRED for compatibility"),
                 inquirer.Text('speed', message="Speed (e.g., 3200MHz) - REQUIRED for compatibility")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer:
                 specs = {k: v for k, v in spec_answer.items() if v}
                 
@@ -199,7 +238,7 @@ class PCBuildCLI:
                 inquirer.List('sata_support', message="SATA Support - REQUIRED", choices=["Yes", "No"], default="Yes"),
                 inquirer.List('nvme_support', message="NVMe Support - REQUIRED", choices=["Yes", "No"], default="Yes")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer:
                 specs = {k: v for k, v in spec_answer.items() if v}
                 
@@ -207,7 +246,7 @@ class PCBuildCLI:
             questions = [
                 inquirer.Text('interface', message="Interface (e.g., NVMe, SATA) - REQUIRED for compatibility")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer:
                 specs = {k: v for k, v in spec_answer.items() if v}
         else:
@@ -216,7 +255,7 @@ class PCBuildCLI:
             questions = [
                 inquirer.Text('spec1', message="Specification 1 (format: key=value, leave empty to finish)")
             ]
-            spec_answer = inquirer.prompt(questions)
+            spec_answer = self.prompt(questions)
             if spec_answer and spec_answer['spec1']:
                 try:
                     key, value = spec_answer['spec1'].split('=', 1)
@@ -260,7 +299,9 @@ class PCBuildCLI:
     def build_pc_menu(self):
         """Build PC submenu with current selections and validation"""
         # Get component types from database, filter to core components only
-        all_component_types = self.pc_builder.get_distinct_component_types()
+        self.connect()
+        with self.profiler.action("build_pc_menu:load_types"):
+            all_component_types = self.pc_builder.get_distinct_component_types()
         core_components = ["CPU", "GPU", "RAM", "Motherboard", "Storage"]
         component_types = [ct for ct in all_component_types if ct in core_components]
         
@@ -296,7 +337,7 @@ class PCBuildCLI:
                 )
             ]
             
-            answer = inquirer.prompt(questions)
+            answer = self.prompt(questions)
             if not answer:
                 break
                 
@@ -304,7 +345,8 @@ class PCBuildCLI:
             
             if action.startswith('select_'):
                 comp_type = action.replace('select_', '')
-                component = self.select_component(comp_type)
+                with self.profiler.action(f"build_pc_menu:{action}"):
+                    component = self.select_component(comp_type)
                 if component:
                     self.selected_components[comp_type] = component
                     print(f"\n✅ {comp_type} selected: {component.name}")
@@ -312,16 +354,19 @@ class PCBuildCLI:
                     # Auto-validate after each selection
                     if len(self.selected_components) > 1:
                         print("\n🔍 Running compatibility check...")
-                        self.validate_build()
+                        with self.profiler.action("build_pc_menu:auto_validate"):
+                            self.validate_build()
                     
                     input("\nPress Enter to continue...")
                     
             elif action == "validate":
-                self.validate_build()
+                with self.profiler.action("build_pc_menu:validate"):
+                    self.validate_build()
                 input("\nPress Enter to continue...")
                 
             elif action == "save":
-                self.save_build_option()
+                with self.profiler.action("build_pc_menu:save"):
+                    self.save_build_option()
                 input("\nPress Enter to continue...")
                 
             elif action == "clear":
@@ -330,7 +375,7 @@ class PCBuildCLI:
                                    message="Are you sure you want to clear all selections?",
                                    default=False)
                 ]
-                confirm_answer = inquirer.prompt(questions)
+                confirm_answer = self.prompt(questions)
                 if confirm_answer and confirm_answer['confirm']:
                     self.selected_components.clear()
                     print("\n🗑️  All selections cleared!")
@@ -358,7 +403,7 @@ class PCBuildCLI:
                 )
             ]
             
-            answer = inquirer.prompt(questions)
+            answer = self.prompt(questions)
             if not answer:
                 break
                 
@@ -368,18 +413,22 @@ class PCBuildCLI:
                 self.build_pc_menu()
                     
             elif action == "insert_component":
-                self.insert_component()
+                self.connect()
+                with self.profiler.action("main_menu:insert_component"):
+                    self.insert_component()
                 input("\nPress Enter to continue...")
                 
             elif action == "view_builds":
-                self.view_existing_builds()
+                self.connect()
+                with self.profiler.action("main_menu:view_builds"):
+                    self.view_existing_builds()
                 input("\nPress Enter to continue...")
                 
             elif action == "exit":
                 break
         
         print("\n👋 Thank you for using PC Build Configuration Tool!")
-        self.pc_builder.close_connection()
+        self.close()
     
     def run(self):
         """Run the CLI application"""
@@ -387,13 +436,26 @@ class PCBuildCLI:
             self.main_menu()
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
-            self.pc_builder.close_connection()
+            self.close()
             sys.exit(0)
         except Exception as e:
             print(f"\n❌ An error occurred: {str(e)}")
-            self.pc_builder.close_connection()
+            self.close()
             sys.exit(1)
+        finally:
+            self.profiler.print_report()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="PC Build Configuration Tool")
+    parser.add_argument("--profile", action="store_true",
+                        help="Report startup and per-action timings on exit")
+    parser.add_argument("--profile-dir", metavar="DIR",
+                        help="Write a cProfile dump per action to DIR (implies --profile)")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    cli = PCBuildCLI()
+    args = parse_args()
+    profiler = CLIProfiler(enabled=args.profile or bool(args.profile_dir), dump_dir=args.profile_dir)
+    profiler.record_startup("import inquirer", INQUIRER_IMPORT_SECONDS)
+    cli = PCBuildCLI(profiler)
     cli.run()
\ No newline at end of file
@@ -1,47 +1,5 @@
-import os
 import json
-import pymysql
-from dotenv import load_dotenv
-
-load_dotenv()
-
-
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = int(os.getenv("DB_PORT"))
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-
-connection = pymysql.connect(
-    host=DB_HOST,
-    port=DB_PORT,
-    user=DB_USER,
-    password=DB_PASSWORD,
-    database=DB_NAME
-)
-
-cursor = connection.cursor()
-
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS components (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-    name VARCHAR(255) NOT NULL,
-    type VARCHAR(50) NOT NULL,
-    specs JSON NOT NULL
-)
-""")
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS builds (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-    name VARCHAR(255) NOT NULL,
-    components_list JSON NOT NULL
-)
-""")
-
-print("Database and tables initialized.")
+from Model import build_components_hash, ensure_build_hash_column, open_connection
 
 
 components_data = [
@@ -105,15 +63,6 @@ components_data = [
 ]
 
 
-for name, type_, specs in components_data:
-    cursor.execute(
-        "INSERT INTO components (name, type, specs) VALUES (%s, %s, %s)",
-        (name, type_, json.dumps(specs))
-    )
-
-print(f" {len(components_data)} components inserted.")
-
-
 builds_data = [
     ("Gaming Build Intel", [1, 5, 9, 13, 17]),   # i5-12400F, RTX 3060, DDR4 16GB, B550M-A, NVMe 1TB
     ("Gaming Build AMD", [2, 6, 10, 14, 18]),    # Ryzen 5600X, RX 6700XT, DDR4 32GB, Z690-A, HDD 2TB
@@ -125,15 +74,61 @@ builds_data = [
     ("Entry Level", [1, 8, 9, 14, 20]),          # i5-12400F, RX 7600, DDR4 16GB, Z690-A, SATA SSD
 ]
 
-for name, comp_ids in builds_data:
-    cursor.execute(
-        "INSERT INTO builds (name, components_list) VALUES (%s, %s)",
-        (name, json.dumps(comp_ids))
+
+def create_tables(cursor):
+    """Create the components and builds tables if they do not exist"""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS components (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        type VARCHAR(50) NOT NULL,
+        specs JSON NOT NULL
+    )
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS builds (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        components_list JSON NOT NULL,
+        components_hash CHAR(64) NULL,
+        INDEX idx_builds_components_hash (components_hash)
     )
+    """)
+
+    # Tables created before builds were content-addressed need the hash column added
+    ensure_build_hash_column(cursor)
+
+
+def seed_data(cursor):
+    """Insert the sample components and builds"""
+    for name, type_, specs in components_data:
+        cursor.execute(
+            "INSERT INTO components (name, type, specs) VALUES (%s, %s, %s)",
+            (name, type_, json.dumps(specs))
+        )
+
+    print(f" {len(components_data)} components inserted.")
+
+    for name, comp_ids in builds_data:
+        cursor.execute(
+            "INSERT INTO builds (name, components_list, components_hash) VALUES (%s, %s, %s)",
+            (name, json.dumps(comp_ids), build_components_hash(comp_ids))
+        )
+
+    print(f" {len(builds_data)} builds inserted.")
+
+
+if __name__ == "__main__":
+    connection = open_connection()
+    cursor = connection.cursor()
+
+    create_tables(cursor)
+    print("Database and tables initialized.")
 
-print(f" {len(builds_data)} builds inserted.")
+    seed_data(cursor)
 
-connection.commit()
-cursor.close()
-connection.close()
-print(" Data committed and connection closed.")
+    connection.commit()
+    cursor.close()
+    connection.close()
+    print(" Data committed and connection closed.")
@@ -0,0 +1,383 @@
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+
+import DatabaseInit
+from Model import PCBuilder, open_connection
+
+CORE_TYPES = ["CPU", "GPU", "RAM", "Motherboard", "Storage"]
+
+# Relative frequency of each operation, roughly following a CLI session:
+# lots of browsing and validation, fewer saves and inserts
+DEFAULT_WEIGHTS = {
+    "get_distinct_component_types": 15,
+    "get_components_by_type": 35,
+    "validate_compatibility": 25,
+    "save_build": 10,
+    "view_builds": 10,
+    "add_component": 5
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Session:
+    """One simulated CLI user with its own PCBuilder connection"""
+
+    def __init__(self, session_id, weights, run_prefix, think_time, rng):
+        self.session_id = session_id
+        self.run_prefix = run_prefix
+        self.think_time = think_time
+        self.rng = rng
+        self.operations = list(weights)
+        self.weights = [weights[op] for op in self.operations]
+        self.samples = []
+        self.counter = 0
+        self.pc_builder = None
+        self.catalog = {}
+
+    def setup(self):
+        """Connect and load the catalog this session picks components from (not timed)"""
+        self.pc_builder = PCBuilder()
+        for comp_type in CORE_TYPES:
+            self.catalog[comp_type] = self.pc_builder.get_components_by_type(comp_type)
+
+    def close(self):
+        if self.pc_builder:
+            self.pc_builder.close_connection()
+
+    def pick_components(self):
+        """Pick one random component of each core type, like a user filling the build menu"""
+        return [self.rng.choice(components) for components in self.catalog.values() if components]
+
+    def run(self, start_event, deadline):
+        start_event.wait()
+        while time.monotonic() < deadline:
+            operation = self.rng.choices(self.operations, weights=self.weights)[0]
+            started = time.perf_counter()
+            try:
+                outcome = getattr(self, f"op_{operation}")()
+            except Exception:
+                outcome = "error"
+            self.samples.append((operation, time.perf_counter() - started, outcome))
+            if self.think_time:
+                time.sleep(self.rng.uniform(0, self.think_time * 2))
+
+    def op_get_distinct_component_types(self):
+        self.pc_builder.get_distinct_component_types()
+        return "ok"
+
+    def op_get_components_by_type(self):
+        self.pc_builder.get_components_by_type(self.rng.choice(CORE_TYPES))
+        return "ok"
+
+    def op_validate_compatibility(self):
+        self.pc_builder.validate_compatibility(self.pick_components())
+        return "ok"
+
+    def op_save_build(self):
+        self.counter += 1
+        component_ids = [component.id for component in self.pick_components()]
+        name = f"{self.run_prefix}-build-{self.session_id}-{self.counter}"
+        success, message = self.pc_builder.save_build(name, component_ids)
+        if success:
+            return "ok"
+        # Incompatible picks are rejected by validation, which is not a failure of the system
+        return "error" if message.startswith("Error") else "rejected"
+
+    def op_view_builds(self):
+        for build in self.pc_builder.get_all_builds():
+            if build.components_list:
+                self.pc_builder.get_components_by_ids(build.components_list)
+        return "ok"
+
+    def op_add_component(self):
+        self.counter += 1
+        name = f"{self.run_prefix}-component-{self.session_id}-{self.counter}"
+        success, _ = self.pc_builder.add_component(name, "Storage", {"interface": self.rng.choice(["NVMe", "SATA"])})
+        return "ok" if success else "error"
+
+
+def seed_database():
+    """Create the tables and load the DatabaseInit sample data into an empty database"""
+    connection = open_connection()
+    try:
+        cursor = connection.cursor()
+        DatabaseInit.create_tables(cursor)
+        cursor.execute("SELECT COUNT(*) FROM components")
+        if cursor.fetchone()[0] == 0:
+            # Keep stdout clean for the JSON report
+            with contextlib.redirect_stdout(sys.stderr):
+                DatabaseInit.seed_data(cursor)
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+
+def cleanup(run_prefix):
+    """Delete the builds and components created by this run"""
+    connection = open_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM builds WHERE name LIKE %s", (f"{run_prefix}-%",))
+        cursor.execute("DELETE FROM components WHERE name LIKE %s", (f"{run_prefix}-%",))
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+
+def latency_stats(entries, elapsed):
+    """Count, error/rejected counts, throughput and latency percentiles for (latency, outcome) pairs"""
+    latencies = sorted(latency for latency, _ in entries)
+    stats = {
+        "count": len(entries),
+        "errors": sum(1 for _, outcome in entries if outcome == "error"),
+        "rejected": sum(1 for _, outcome in entries if outcome == "rejected"),
+        "throughput_ops_s": round(len(entries) / elapsed, 3) if elapsed else 0.0
+    }
+    for key, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99), ("max_ms", 1.0)):
+        value = percentile(latencies, fraction)
+        stats[key] = round(value * 1000, 3) if value is not None else None
+    return stats
+
+
+def summarize(samples, elapsed):
+    """Overall and per-operation throughput, latency percentiles and error counts"""
+    by_operation = {}
+    for operation, latency, outcome in samples:
+        by_operation.setdefault(operation, []).append((latency, outcome))
+
+    operations = {operation: latency_stats(entries, elapsed) for operation, entries in sorted(by_operation.items())}
+    overall = latency_stats([(latency, outcome) for _, latency, outcome in samples], elapsed)
+    return {**overall, "operations": operations}
+
+
+def run_sessions(session_ids, seeds, weights, run_prefix, think_time, duration, on_ready=None, start_event=None,
+                 start_timeout=None):
+    """Run a group of sessions as threads in this process
+
+    Returns (samples, session_errors, active_sessions, elapsed). on_ready is
+    called once every session has connected; the run starts when
+    start_event is set, or fails with RuntimeError after start_timeout.
+    """
+    workers = []
+    session_errors = []
+    for session_id, seed in zip(session_ids, seeds):
+        worker = Session(session_id, weights, run_prefix, think_time, random.Random(seed))
+        try:
+            worker.setup()
+            workers.append(worker)
+        except Exception as e:
+            worker.close()
+            session_errors.append(f"session {session_id}: {str(e)}")
+
+    if on_ready:
+        on_ready()
+    if start_event and not start_event.wait(start_timeout):
+        for worker in workers:
+            worker.close()
+        raise RuntimeError("timed out waiting for the start signal")
+
+    local_start = threading.Event()
+    started = time.monotonic()
+    deadline = started + duration
+    threads = [threading.Thread(target=worker.run, args=(local_start, deadline)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    local_start.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    for worker in workers:
+        worker.close()
+
+    samples = [sample for worker in workers for sample in worker.samples]
+    return samples, session_errors, len(workers), elapsed
+
+
+def _session_process(index, session_ids, seeds, weights, run_prefix, think_time, duration, start_event, results,
+                     start_timeout):
+    """Entry point for one load-generator process"""
+    try:
+        outcome = run_sessions(
+            session_ids, seeds, weights, run_prefix, think_time, duration,
+            on_ready=lambda: results.put((index, "ready", None)),
+            start_event=start_event,
+            start_timeout=start_timeout
+        )
+        results.put((index, "done", outcome))
+    except Exception as e:
+        results.put((index, "failed", f"process for sessions {session_ids}: {str(e)}"))
+
+
+def _run_in_processes(processes, seeds, weights, run_prefix, think_time, duration, start_timeout=60.0):
+    """Spread sessions over separate processes so client-side GIL contention does not skew latencies"""
+    groups = [list(range(first, len(seeds), processes)) for first in range(processes)]
+    groups = [group for group in groups if group]
+
+    start_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=_session_process,
+            args=(index, group, [seeds[i] for i in group], weights, run_prefix, think_time, duration,
+                  start_event, results, start_timeout)
+        )
+        for index, group in enumerate(groups)
+    ]
+    for worker in workers:
+        worker.start()
+
+    samples, session_errors, active, elapsed = [], [], 0, 0.0
+    ready = set()
+    finished = set()
+    while len(finished) < len(workers):
+        try:
+            index, kind, payload = results.get(timeout=1.0)
+        except queue.Empty:
+            # A child killed hard (OOM, segfault) never reports; count it as finished
+            for index, worker in enumerate(workers):
+                if index not in finished and worker.exitcode is not None:
+                    finished.add(index)
+                    session_errors.append(
+                        f"process for sessions {groups[index]}: exited with code {worker.exitcode} without reporting"
+                    )
+        else:
+            if kind == "ready":
+                ready.add(index)
+            elif kind == "done":
+                finished.add(index)
+                group_samples, group_errors, group_active, group_elapsed = payload
+                samples.extend(group_samples)
+                session_errors.extend(group_errors)
+                active += group_active
+                elapsed = max(elapsed, group_elapsed)
+            else:
+                finished.add(index)
+                session_errors.append(payload)
+
+        # Start every surviving process together once all of them have connected or gone
+        if not start_event.is_set() and len(ready | finished) == len(workers):
+            start_event.set()
+
+    for worker in workers:
+        worker.join()
+    return samples, session_errors, active, elapsed
+
+
+def run_load_test(sessions, duration, weights, think_time=0.0, random_seed=None, processes=1):
+    """Run concurrent sessions for `duration` seconds and return the JSON-ready report"""
+    run_prefix = f"loadtest-{uuid.uuid4().hex[:8]}"
+    master_rng = random.Random(random_seed)
+    seeds = [master_rng.random() for _ in range(sessions)]
+    processes = max(1, min(processes, sessions))
+
+    if processes == 1:
+        samples, session_errors, active, elapsed = run_sessions(
+            list(range(sessions)), seeds, weights, run_prefix, think_time, duration
+        )
+    else:
+        samples, session_errors, active, elapsed = _run_in_processes(
+            processes, seeds, weights, run_prefix, think_time, duration
+        )
+
+    return {
+        "run_prefix": run_prefix,
+        "config": {
+            "sessions": sessions,
+            "processes": processes,
+            # Sessions in one process share its GIL; with many sessions per process the
+            # client itself can add latency, so raise processes for high session counts
+            "sessions_per_process": math.ceil(sessions / processes),
+            "duration_s": duration,
+            "think_time_s": think_time,
+            "weights": weights
+        },
+        "active_sessions": active,
+        "session_errors": session_errors,
+        "elapsed_s": round(elapsed, 3),
+        **summarize(samples, elapsed)
+    }
+
+
+def parse_weights(value):
+    """Parse 'op=weight,op=weight' overrides on top of DEFAULT_WEIGHTS"""
+    weights = dict(DEFAULT_WEIGHTS)
+    if not value:
+        return weights
+    for item in value.split(","):
+        try:
+            operation, weight = item.split("=", 1)
+            operation = operation.strip()
+            weight = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight '{item}', expected op=weight")
+        if operation not in DEFAULT_WEIGHTS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{operation}', choose from {', '.join(DEFAULT_WEIGHTS)}")
+        if weight < 0:
+            raise argparse.ArgumentTypeError(f"Weight for '{operation}' must not be negative")
+        weights[operation] = weight
+    weights = {operation: weight for operation, weight in weights.items() if weight > 0}
+    if not weights:
+        raise argparse.ArgumentTypeError("At least one operation needs a positive weight")
+    return weights
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent PC Build users against a local database")
+    parser.add_argument("--sessions", type=int, default=10,
+                        help="Number of simultaneous sessions. Sessions in one process are threads sharing "
+                             "its GIL, so use --processes for high counts to keep the client from skewing latencies")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Number of load-generator processes to spread the sessions over")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run time in seconds")
+    parser.add_argument("--weights", type=parse_weights, default=dict(DEFAULT_WEIGHTS),
+                        help="Operation weights as op=weight,... (0 disables an operation)")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Mean pause between operations per session, in seconds")
+    parser.add_argument("--random-seed", type=int, help="Seed for reproducible operation mixes")
+    parser.add_argument("--seed", action="store_true",
+                        help="Create the tables and load the DatabaseInit sample data if the database is empty")
+    parser.add_argument("--cleanup", action="store_true",
+                        help="Delete the builds and components created by this run afterwards")
+    parser.add_argument("--output", metavar="FILE", help="Write the JSON report to FILE instead of stdout")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.seed:
+        seed_database()
+
+    report = run_load_test(args.sessions, args.duration, args.weights, args.think_time, args.random_seed,
+                           args.processes)
+
+    if args.cleanup:
+        cleanup(report["run_prefix"])
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    sys.exit(1 if report["errors"] or report["session_errors"] else 0)
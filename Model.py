@@ -1,48 +1,115 @@
 import os
 import json
+import hashlib
+import queue
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
 import pymysql
 from dotenv import load_dotenv
 
-load_dotenv()
+_environment_loaded = False
+
+def load_environment():
+    """Load .env settings once, on first use rather than at import"""
+    global _environment_loaded
+    if not _environment_loaded:
+        load_dotenv()
+        _environment_loaded = True
+
+def open_connection():
+    """Open a new database connection from the environment settings"""
+    load_environment()
+    DB_HOST = os.getenv("DB_HOST")
+    DB_PORT = int(os.getenv("DB_PORT"))
+    DB_NAME = os.getenv("DB_NAME")
+    DB_USER = os.getenv("DB_USER")
+    DB_PASSWORD = os.getenv("DB_PASSWORD")
+
+    return pymysql.connect(
+        host=DB_HOST,
+        port=DB_PORT,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        database=DB_NAME
+    )
+
+INSERT_STATEMENTS = {
+    "components": "INSERT INTO components (name, type, specs) VALUES (%s, %s, %s)",
+    "builds": "INSERT INTO builds (name, components_list, components_hash) VALUES (%s, %s, %s)"
+}
+
+def build_components_hash(component_ids):
+    """Canonical SHA-256 of a build's component IDs, independent of their order"""
+    canonical = ",".join(str(component_id) for component_id in sorted(int(i) for i in component_ids))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def ensure_build_hash_column(cursor):
+    """Add the indexed components_hash column to an existing builds table if it is missing"""
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'builds' AND COLUMN_NAME = 'components_hash'"
+    )
+    if cursor.fetchone()[0] == 0:
+        cursor.execute(
+            "ALTER TABLE builds ADD COLUMN components_hash CHAR(64) NULL, "
+            "ADD INDEX idx_builds_components_hash (components_hash)"
+        )
 
 class Component:
     def __init__(self, id=None, name=None, type=None, specs=None):
         self.id = id
         self.name = name
         self.type = type
-        self.specs = specs if isinstance(specs, dict) else json.loads(specs) if specs else {}
+        self.specs = specs
+
+    @property
+    def specs(self):
+        """Specs dict, decoded from the raw JSON on first access"""
+        if self._specs is None:
+            self._specs = (json.loads(self._raw_specs) if self._raw_specs else None) or {}
+            self._raw_specs = None
+        return self._specs
+
+    def raw_specs(self):
+        """Specs as JSON text, without decoding them if they have not been read yet"""
+        if self._specs is None:
+            return self._raw_specs or ""
+        return json.dumps(self._specs)
+
+    @specs.setter
+    def specs(self, specs):
+        if isinstance(specs, dict):
+            self._specs = specs
+            self._raw_specs = None
+        else:
+            self._specs = None
+            self._raw_specs = specs
 
 class Build:
-    def __init__(self, id=None, name=None, components_list=None):
+    def __init__(self, id=None, name=None, components_list=None, components_hash=None):
         self.id = id
         self.name = name
         self.components_list = components_list if isinstance(components_list, list) else json.loads(components_list) if components_list else []
+        self.components_hash = components_hash
 
 class PCBuilder:
     def __init__(self):
         self.connection = None
         self.cursor = None
+        self.write_queue = None
         self.connect_to_db()
 
     def connect_to_db(self):
         """Establish database connection"""
-        DB_HOST = os.getenv("DB_HOST")
-        DB_PORT = int(os.getenv("DB_PORT"))
-        DB_NAME = os.getenv("DB_NAME")
-        DB_USER = os.getenv("DB_USER")
-        DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-        self.connection = pymysql.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
+        self.connection = open_connection()
         self.cursor = self.connection.cursor()
 
     def close_connection(self):
         """Close database connection"""
+        self.disable_write_behind()
         if self.cursor:
             self.cursor.close()
         if self.connection:
@@ -91,6 +158,30 @@ class PCBuilder:
             components.append(Component(id=result[0], name=result[1], type=result[2], specs=result[3]))
         return components
 
+    def get_component_names_by_type(self, component_type):
+        """Get (id, name) pairs for a type without fetching specs
+
+        For name-only listings; every current CLI screen shows specs, so the
+        CLI still uses get_components_by_type.
+        """
+        self.cursor.execute("SELECT id, name FROM components WHERE type = %s", (component_type,))
+        results = self.cursor.fetchall()
+        return [(result[0], result[1]) for result in results]
+
+    def get_component_names_by_ids(self, component_ids):
+        """Get (id, name, type) tuples for the given IDs without fetching specs
+
+        For name-only listings; use get_components_by_ids when specs are shown.
+        """
+        if not component_ids:
+            return []
+
+        placeholders = ','.join(['%s'] * len(component_ids))
+        query = f"SELECT id, name, type FROM components WHERE id IN ({placeholders})"
+        self.cursor.execute(query, component_ids)
+        results = self.cursor.fetchall()
+        return [(result[0], result[1], result[2]) for result in results]
+
     def get_distinct_component_types(self):
         """Get all distinct component types from database"""
         self.cursor.execute("SELECT DISTINCT type FROM components ORDER BY type")
@@ -181,8 +272,8 @@ class PCBuilder:
 
             # Save build to database
             self.cursor.execute(
-                "INSERT INTO builds (name, components_list) VALUES (%s, %s)",
-                (name, json.dumps(component_ids))
+                INSERT_STATEMENTS["builds"],
+                (name, json.dumps(component_ids), build_components_hash(component_ids))
             )
             self.connection.commit()
             return True, f"Build '{name}' saved successfully"
@@ -193,22 +284,105 @@ class PCBuilder:
 
     def get_build_by_id(self, build_id):
         """Get a build by ID"""
-        self.cursor.execute("SELECT id, name, components_list FROM builds WHERE id = %s", (build_id,))
+        self.cursor.execute("SELECT id, name, components_list, components_hash FROM builds WHERE id = %s", (build_id,))
         result = self.cursor.fetchone()
         if result:
-            return Build(id=result[0], name=result[1], components_list=result[2])
+            return Build(id=result[0], name=result[1], components_list=result[2], components_hash=result[3])
         return None
 
     def get_all_builds(self):
         """Get all builds from database"""
-        self.cursor.execute("SELECT id, name, components_list FROM builds")
+        self.cursor.execute("SELECT id, name, components_list, components_hash FROM builds")
         results = self.cursor.fetchall()
         
         builds = []
         for result in results:
-            builds.append(Build(id=result[0], name=result[1], components_list=result[2]))
+            builds.append(Build(id=result[0], name=result[1], components_list=result[2], components_hash=result[3]))
         return builds
 
+    def find_or_save_build(self, name, component_ids, lock_timeout=10):
+        """Return the existing build with these components, or save a new one
+
+        Returns (success, message, build, created). created is False when an
+        existing build was returned; build is None when the save failed.
+        The lookup and insert run under a MySQL named lock per component
+        hash, so concurrent saves of the same set cannot both insert.
+        """
+        components_hash = build_components_hash(component_ids)
+        # GET_LOCK names are limited to 64 characters
+        lock_name = f"pcbuilder:build:{components_hash[:40]}"
+        try:
+            self.cursor.execute("SELECT GET_LOCK(%s, %s)", (lock_name, lock_timeout))
+            if self.cursor.fetchone()[0] != 1:
+                return False, "Error saving build: timed out waiting for a concurrent save of the same components", None, False
+        except Exception as e:
+            self.connection.rollback()
+            return False, f"Error saving build: {str(e)}", None, False
+
+        try:
+            # Start a fresh snapshot so a build committed by the previous lock holder is visible
+            self.connection.commit()
+            try:
+                existing = self.find_build_by_components(component_ids)
+            except Exception as e:
+                self.connection.rollback()
+                return False, f"Error saving build: {str(e)}", None, False
+            if existing:
+                return True, f"Build '{existing.name}' already exists (ID: {existing.id})", existing, False
+
+            success, message = self.save_build(name, component_ids)
+            if not success:
+                return False, message, None, False
+            return True, message, Build(
+                id=self.cursor.lastrowid,
+                name=name,
+                components_list=list(component_ids),
+                components_hash=components_hash
+            ), True
+        finally:
+            try:
+                self.cursor.execute("SELECT RELEASE_LOCK(%s)", (lock_name,))
+                self.cursor.fetchone()
+            except Exception:
+                pass
+
+    def find_build_by_components(self, component_ids):
+        """Find an existing build with exactly this component set using the hash index"""
+        components_hash = build_components_hash(component_ids)
+        self.cursor.execute(
+            "SELECT id, name, components_list, components_hash FROM builds WHERE components_hash = %s ORDER BY id",
+            (components_hash,)
+        )
+        wanted = sorted(int(i) for i in component_ids)
+        for result in self.cursor.fetchall():
+            build = Build(id=result[0], name=result[1], components_list=result[2], components_hash=result[3])
+            # Guard against hash collisions by comparing the actual IDs
+            if sorted(int(i) for i in build.components_list) == wanted:
+                return build
+        return None
+
+    def backfill_build_hashes(self, batch_size=500):
+        """Compute components_hash for builds saved before the column existed"""
+        ensure_build_hash_column(self.cursor)
+        updated = 0
+        while True:
+            self.cursor.execute(
+                "SELECT id, components_list FROM builds WHERE components_hash IS NULL ORDER BY id LIMIT %s",
+                (batch_size,)
+            )
+            results = self.cursor.fetchall()
+            if not results:
+                break
+
+            rows = [
+                (build_components_hash(Build(id=result[0], components_list=result[1]).components_list), result[0])
+                for result in results
+            ]
+            self.cursor.executemany("UPDATE builds SET components_hash = %s WHERE id = %s", rows)
+            self.connection.commit()
+            updated += len(rows)
+        return updated
+
     def delete_build(self, build_id):
         """Delete a build by ID"""
         try:
@@ -225,14 +399,477 @@ class PCBuilder:
     def add_component(self, name, component_type, specs):
         """Add a new component to the database"""
         try:
-            self.cursor.execute(
-                "INSERT INTO components (name, type, specs) VALUES (%s, %s, %s)",
-                (name, component_type, json.dumps(specs))
-            )
+            self.cursor.execute(INSERT_STATEMENTS["components"], (name, component_type, json.dumps(specs)))
             self.connection.commit()
             return True, f"Component '{name}' added successfully"
         except Exception as e:
             self.connection.rollback()
             return False, f"Error adding component: {str(e)}"
 
+    def enable_write_behind(self, batch_size=100, max_delay=0.05, max_pending=1000):
+        """Queue add_component_async/save_build_async writes and commit them in batches"""
+        if self.write_queue is None:
+            self.write_queue = WriteBehindQueue(batch_size=batch_size, max_delay=max_delay, max_pending=max_pending)
+
+    def disable_write_behind(self):
+        """Flush pending queued writes and stop the writer thread"""
+        if self.write_queue is not None:
+            self.write_queue.close()
+            self.write_queue = None
+
+    def add_component_async(self, name, component_type, specs):
+        """Queue a new component; returns a Future resolving to (success, message)"""
+        if self.write_queue is None:
+            return _completed_future(self.add_component(name, component_type, specs))
+        return self.write_queue.submit(
+            "components",
+            (name, component_type, json.dumps(specs)),
+            f"Component '{name}' added successfully",
+            "Error adding component"
+        )
+
+    def save_build_async(self, name, component_ids):
+        """Validate a build now and queue the insert; returns a Future resolving to (success, message)"""
+        if self.write_queue is None:
+            return _completed_future(self.save_build(name, component_ids))
+
+        try:
+            components = self.get_components_by_ids(component_ids)
+            if len(components) != len(component_ids):
+                return _completed_future((False, "Some component IDs are invalid"))
+
+            valid, message = self.validate_compatibility(components)
+            if not valid:
+                return _completed_future((False, message))
+        except Exception as e:
+            self.connection.rollback()
+            return _completed_future((False, f"Error saving build: {str(e)}"))
+
+        return self.write_queue.submit(
+            "builds",
+            (name, json.dumps(component_ids), build_components_hash(component_ids)),
+            f"Build '{name}' saved successfully",
+            "Error saving build"
+        )
+
+    def find_or_save_build_async(self, name, component_ids):
+        """Like find_or_save_build, but queues the insert; returns a Future
+
+        The existing-build check runs at submit time, so identical builds
+        that are still queued are not detected as duplicates of each other.
+        A newly queued build has id None, as the row ID is not known until
+        its batch commits.
+        """
+        try:
+            existing = self.find_build_by_components(component_ids)
+        except Exception as e:
+            self.connection.rollback()
+            return _completed_future((False, f"Error saving build: {str(e)}", None, False))
+        if existing:
+            return _completed_future((True, f"Build '{existing.name}' already exists (ID: {existing.id})", existing, False))
+
+        saved = self.save_build_async(name, component_ids)
+        result = Future()
+
+        def resolve(future):
+            if future.cancelled():
+                result.cancel()
+                return
+            success, message = future.result()
+            build = None
+            if success:
+                build = Build(
+                    name=name,
+                    components_list=list(component_ids),
+                    components_hash=build_components_hash(component_ids)
+                )
+            result.set_result((success, message, build, success))
+
+        saved.add_done_callback(resolve)
+        return result
+
+
+def _completed_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class WriteBehindQueue:
+    """Bounded write queue flushed by a writer thread as one transaction per batch"""
+
+    _STOP = object()
 
+    def __init__(self, batch_size=100, max_delay=0.05, max_pending=1000):
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.closed = False
+        # Guards the closed check and the put so nothing is queued behind the stop marker
+        self.lock = threading.Lock()
+        # pymysql connections are not thread safe, so the writer gets its own
+        self.connection = open_connection()
+        self.thread = threading.Thread(target=self._run, name="pcbuilder-write-behind", daemon=True)
+        self.thread.start()
+
+    def submit(self, table, params, success_message, error_prefix):
+        """Queue an insert, blocking while the queue is full"""
+        future = Future()
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Write-behind queue is closed")
+            self.pending.put((table, params, success_message, error_prefix, future))
+        return future
+
+    def close(self):
+        """Flush everything already queued, then stop the writer thread"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.pending.put(self._STOP)
+        self.thread.join()
+        self.connection.close()
+
+    def _run(self):
+        while True:
+            batch, stopping = self._take_batch()
+            try:
+                if batch:
+                    self._flush(batch)
+            except Exception as e:
+                # Never let the writer thread die; fail this batch and keep serving the queue
+                for _, _, _, error_prefix, future in batch:
+                    if not future.done():
+                        future.set_result((False, f"{error_prefix}: {str(e)}"))
+            if stopping:
+                return
+
+    def _take_batch(self):
+        """Collect up to batch_size items or whatever arrives within max_delay"""
+        batch = []
+        item = self.pending.get()
+        if item is self._STOP:
+            return batch, True
+
+        stopping = False
+        deadline = time.monotonic() + self.max_delay
+        while True:
+            # Cancelled futures are dropped; the rest can no longer be cancelled once running
+            if item[4].set_running_or_notify_cancel():
+                batch.append(item)
+            if len(batch) >= self.batch_size:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                stopping = True
+                break
+        return batch, stopping
+
+    def _flush(self, batch):
+        """Commit a batch as multi-row inserts, falling back to per-item commits on error"""
+        try:
+            self.connection.ping(reconnect=True)
+            cursor = self.connection.cursor()
+            try:
+                for table, statement in INSERT_STATEMENTS.items():
+                    rows = [item[1] for item in batch if item[0] == table]
+                    if rows:
+                        cursor.executemany(statement, rows)
+                self.connection.commit()
+            finally:
+                cursor.close()
+        except Exception:
+            self._rollback()
+            self._flush_individually(batch)
+            return
+
+        for _, _, success_message, _, future in batch:
+            future.set_result((True, success_message))
+
+    def _flush_individually(self, batch):
+        for table, params, success_message, error_prefix, future in batch:
+            try:
+                cursor = self.connection.cursor()
+                try:
+                    cursor.execute(INSERT_STATEMENTS[table], params)
+                    self.connection.commit()
+                finally:
+                    cursor.close()
+                future.set_result((True, success_message))
+            except Exception as e:
+                self._rollback()
+                future.set_result((False, f"{error_prefix}: {str(e)}"))
+
+    def _rollback(self):
+        try:
+            self.connection.rollback()
+        except Exception:
+            pass
+
+
+# Shared-memory catalog layout (all integers little-endian):
+#   header | type table | records (sorted by type, id) | id index (sorted by id) | string blob
+# Offsets and lengths in the type table and records point into the string blob.
+CATALOG_MAGIC = b"PCC1"
+CATALOG_HEADER = struct.Struct("<4sQII")         # magic, generation, component count, type count
+CATALOG_TYPE_ENTRY = struct.Struct("<IIII")      # name offset, name length, first record, record count
+CATALOG_RECORD = struct.Struct("<IIIIII")        # id, type index, name offset, name length, specs offset, specs length
+CATALOG_ID_ENTRY = struct.Struct("<II")          # id, record index
+CATALOG_CONTROL = struct.Struct("<Q")            # current generation
+
+
+def _attach_shared_memory(name):
+    """Attach to an existing segment without letting this process unlink it on exit"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers attached segments with the resource tracker
+        segment = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+def encode_catalog(components, generation):
+    """Encode components into the compact shared-memory catalog format"""
+    components = sorted(components, key=lambda c: (c.type, c.id))
+    blob = bytearray()
+
+    def add_string(value):
+        data = value.encode("utf-8")
+        offset = len(blob)
+        blob.extend(data)
+        return offset, len(data)
+
+    types = []
+    records = []
+    for index, component in enumerate(components):
+        if not types or types[-1][0] != component.type:
+            types.append([component.type, index, 0])
+        types[-1][2] += 1
+        name_offset, name_length = add_string(component.name)
+        specs_offset, specs_length = add_string(component.raw_specs())
+        records.append((component.id, len(types) - 1, name_offset, name_length, specs_offset, specs_length))
+
+    type_entries = []
+    for type_name, first_record, record_count in types:
+        name_offset, name_length = add_string(type_name)
+        type_entries.append((name_offset, name_length, first_record, record_count))
+
+    id_index = sorted((record[0], index) for index, record in enumerate(records))
+
+    data = bytearray(CATALOG_HEADER.pack(CATALOG_MAGIC, generation, len(records), len(type_entries)))
+    for entry in type_entries:
+        data.extend(CATALOG_TYPE_ENTRY.pack(*entry))
+    for record in records:
+        data.extend(CATALOG_RECORD.pack(*record))
+    for entry in id_index:
+        data.extend(CATALOG_ID_ENTRY.pack(*entry))
+    data.extend(blob)
+    return bytes(data)
+
+
+class CatalogPublisher:
+    """Loads the components table once and publishes it to shared memory for other processes
+
+    Only CatalogPublisher.add_component republishes immediately. Components
+    inserted any other way (PCBuilder.add_component, add_component_async,
+    the CLI) stay invisible to readers until publish() or
+    publish_if_changed() is called, e.g. from a periodic job.
+    """
+
+    def __init__(self, pc_builder=None, name="pcbuilder_catalog"):
+        self.pc_builder = pc_builder or PCBuilder()
+        self.name = name
+        self.generation = 0
+        self.segment = None
+        self.published_state = None
+        self.control = shared_memory.SharedMemory(name=name, create=True, size=CATALOG_CONTROL.size)
+        CATALOG_CONTROL.pack_into(self.control.buf, 0, 0)
+
+    def publish(self):
+        """Write a new catalog generation and switch readers over to it"""
+        generation = self.generation + 1
+        # Read the table state first so rows inserted during the load trigger another publish
+        state = self._table_state()
+        data = encode_catalog(self.pc_builder.get_all_components(), generation)
+
+        segment = shared_memory.SharedMemory(name=f"{self.name}_{generation}", create=True, size=len(data))
+        segment.buf[:len(data)] = data
+
+        # Readers pick up the new segment once the control generation changes
+        CATALOG_CONTROL.pack_into(self.control.buf, 0, generation)
+        previous = self.segment
+        self.segment = segment
+        self.generation = generation
+        self.published_state = state
+
+        if previous:
+            previous.close()
+            previous.unlink()
+        return generation
+
+    def publish_if_changed(self):
+        """Republish if components were added or removed since the last publish; returns the generation"""
+        if self._table_state() != self.published_state:
+            return self.publish()
+        return self.generation
+
+    def _table_state(self):
+        self.pc_builder.cursor.execute("SELECT COUNT(*), MAX(id) FROM components")
+        state = tuple(self.pc_builder.cursor.fetchone())
+        # End the read snapshot so the next check sees rows committed by other connections
+        self.pc_builder.connection.commit()
+        return state
+
+    def add_component(self, name, component_type, specs):
+        """Add a component to the database and republish the catalog"""
+        success, message = self.pc_builder.add_component(name, component_type, specs)
+        if success:
+            self.publish()
+        return success, message
+
+    def close(self):
+        """Remove the catalog segments"""
+        CATALOG_CONTROL.pack_into(self.control.buf, 0, 0)
+        if self.segment:
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+        self.control.close()
+        self.control.unlink()
+
+
+class SharedCatalog:
+    """Read-only view of a catalog published by CatalogPublisher"""
+
+    def __init__(self, name="pcbuilder_catalog", attach_timeout=5.0):
+        self.name = name
+        self.attach_timeout = attach_timeout
+        self.control = _attach_shared_memory(name)
+        self.generation = 0
+        self.segment = None
+        self.buf = None
+        self.refresh()
+
+    def refresh(self):
+        """Switch to the latest published generation if it has changed"""
+        deadline = time.monotonic() + self.attach_timeout
+        while True:
+            generation = CATALOG_CONTROL.unpack_from(self.control.buf, 0)[0]
+            if generation == 0:
+                raise RuntimeError(f"Catalog '{self.name}' has not been published")
+            if generation == self.generation:
+                return generation
+            try:
+                segment = _attach_shared_memory(f"{self.name}_{generation}")
+            except FileNotFoundError:
+                # The publisher replaced this generation before we attached; re-read the control block
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.001)
+                continue
+
+            self._release()
+            self.segment = segment
+            self.buf = segment.buf
+            magic, generation, self.component_count, self.type_count = CATALOG_HEADER.unpack_from(self.buf, 0)
+            if magic != CATALOG_MAGIC:
+                raise RuntimeError(f"Catalog '{self.name}' has an unknown format")
+            self.generation = generation
+            self.types_offset = CATALOG_HEADER.size
+            self.records_offset = self.types_offset + self.type_count * CATALOG_TYPE_ENTRY.size
+            self.index_offset = self.records_offset + self.component_count * CATALOG_RECORD.size
+            self.blob_offset = self.index_offset + self.component_count * CATALOG_ID_ENTRY.size
+            return generation
+
+    def _release(self):
+        if self.segment:
+            self.buf = None
+            self.segment.close()
+            self.segment = None
+
+    def close(self):
+        """Detach from the catalog segments"""
+        self._release()
+        self.control.close()
+
+    def _string(self, offset, length):
+        start = self.blob_offset + offset
+        return bytes(self.buf[start:start + length]).decode("utf-8")
+
+    def _type_entry(self, index):
+        return CATALOG_TYPE_ENTRY.unpack_from(self.buf, self.types_offset + index * CATALOG_TYPE_ENTRY.size)
+
+    def _component(self, record_index):
+        component_id, type_index, name_offset, name_length, specs_offset, specs_length = CATALOG_RECORD.unpack_from(
+            self.buf, self.records_offset + record_index * CATALOG_RECORD.size
+        )
+        type_offset, type_length, _, _ = self._type_entry(type_index)
+        return Component(
+            id=component_id,
+            name=self._string(name_offset, name_length),
+            type=self._string(type_offset, type_length),
+            specs=self._string(specs_offset, specs_length)
+        )
+
+    def _find_record(self, component_id):
+        """Binary search the id index for a component's record"""
+        low, high = 0, self.component_count
+        while low < high:
+            middle = (low + high) // 2
+            entry_id, record_index = CATALOG_ID_ENTRY.unpack_from(self.buf, self.index_offset + middle * CATALOG_ID_ENTRY.size)
+            if entry_id == component_id:
+                return record_index
+            if entry_id < component_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get_component_by_id(self, component_id):
+        """Get a single component by ID"""
+        self.refresh()
+        record_index = self._find_record(component_id)
+        if record_index is None:
+            return None
+        return self._component(record_index)
+
+    def get_components_by_ids(self, component_ids):
+        """Get multiple components by their IDs"""
+        self.refresh()
+        components = []
+        for component_id in component_ids:
+            record_index = self._find_record(component_id)
+            if record_index is not None:
+                components.append(self._component(record_index))
+        return components
+
+    def get_all_components(self):
+        """Get all components in the catalog"""
+        self.refresh()
+        return [self._component(index) for index in range(self.component_count)]
+
+    def get_components_by_type(self, component_type):
+        """Get components filtered by type"""
+        self.refresh()
+        for index in range(self.type_count):
+            type_offset, type_length, first_record, record_count = self._type_entry(index)
+            if self._string(type_offset, type_length) == component_type:
+                return [self._component(first_record + offset) for offset in range(record_count)]
+        return []
+
+    def get_distinct_component_types(self):
+        """Get all distinct component types in the catalog"""
+        self.refresh()
+        types = []
+        for index in range(self.type_count):
+            type_offset, type_length, _, _ = self._type_entry(index)
+            types.append(self._string(type_offset, type_length))
+        return sorted(types)
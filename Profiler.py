@@ -0,0 +1,121 @@
+import cProfile
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+
+class CLIProfiler:
+    """Collects startup and per-action wall times for the CLI when --profile is set"""
+
+    def __init__(self, enabled=False, dump_dir=None):
+        self.enabled = enabled
+        self.dump_dir = dump_dir
+        self.startup = []
+        self.actions = {}
+        self.dump_count = 0
+        # [profile, paused seconds] for each action currently being timed
+        self.active = []
+        if self.enabled and self.dump_dir:
+            os.makedirs(self.dump_dir, exist_ok=True)
+
+    def record_startup(self, step, seconds):
+        """Record a startup step that was timed elsewhere"""
+        if self.enabled:
+            self.startup.append((step, seconds))
+
+    @contextmanager
+    def startup_step(self, step):
+        """Time a startup step such as an import or the DB connect"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_startup(step, time.perf_counter() - started)
+
+    @contextmanager
+    def action(self, name):
+        """Time a menu action, dumping a cProfile file per call if a dump directory is set"""
+        if not self.enabled:
+            yield
+            return
+
+        profile = cProfile.Profile() if self.dump_dir else None
+        frame = [profile, 0.0]
+        self.active.append(frame)
+        started = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            self.active.remove(frame)
+            self.actions.setdefault(name, []).append(time.perf_counter() - started - frame[1])
+            if profile:
+                self.dump_count += 1
+                safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+                profile.dump_stats(os.path.join(self.dump_dir, f"{self.dump_count:03d}_{safe_name}.prof"))
+
+    @contextmanager
+    def paused(self):
+        """Exclude user wait (prompts) from the timing and cProfile data of running actions"""
+        if not self.enabled or not self.active:
+            yield
+            return
+
+        for profile, _ in self.active:
+            if profile:
+                profile.disable()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            waited = time.perf_counter() - started
+            for frame in self.active:
+                frame[1] += waited
+                if frame[0]:
+                    frame[0].enable()
+
+    def report(self):
+        """Summarize the collected timings as a dict"""
+        actions = {}
+        for name, durations in self.actions.items():
+            actions[name] = {
+                "calls": len(durations),
+                "total_s": round(sum(durations), 6),
+                "mean_s": round(sum(durations) / len(durations), 6),
+                "max_s": round(max(durations), 6)
+            }
+        return {
+            "startup": [{"step": step, "seconds": round(seconds, 6)} for step, seconds in self.startup],
+            "startup_total_s": round(sum(seconds for _, seconds in self.startup), 6),
+            "actions": actions
+        }
+
+    def print_report(self):
+        """Print the timing summary and save it next to the cProfile dumps"""
+        if not self.enabled:
+            return
+        report = self.report()
+
+        print("\n" + "="*50)
+        print("⏱️  PROFILE")
+        print("="*50)
+        print("Startup:")
+        for entry in report["startup"]:
+            print(f"  • {entry['step']}: {entry['seconds'] * 1000:.1f} ms")
+        print(f"  • total: {report['startup_total_s'] * 1000:.1f} ms")
+        print("Actions:")
+        for name, stats in report["actions"].items():
+            print(f"  • {name}: {stats['calls']} call(s), mean {stats['mean_s'] * 1000:.1f} ms, max {stats['max_s'] * 1000:.1f} ms")
+        print("="*50)
+
+        if self.dump_dir:
+            with open(os.path.join(self.dump_dir, "summary.json"), "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"📁 cProfile dumps and summary.json written to {self.dump_dir}")